@@ -1,10 +1,46 @@
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import copy
 import json
+import time
+import hashlib
+from types import MappingProxyType
 import numpy as np
 import pyarrow as pa
 import pyarrow.parquet as pq
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# string values the scheduler uses to mean "no value"; real nulls are caught with isna()
+_STRING_SENTINELS = frozenset({"NaN", "null", ""})
+
+# the string dtype to_df produces; the "string[pyarrow]" alias is StringDtype, which merges with it as object
+_STRING_DTYPE = pd.ArrowDtype(pa.string())
+
+def read_json(response: requests.Response):
+    """
+    Raise for an HTTP error status, then parse the response body, using orjson when it is installed.
+
+    Parameters:
+    - response: the requests response
+
+    Returns:
+    - the decoded JSON (dict or list)
+    """
+    response.raise_for_status()
+    return orjson.loads(response.content) if orjson else response.json()
+
+def write_json(body) -> bytes:
+    """Serialize a request body to JSON bytes, using orjson when it is installed."""
+    return orjson.dumps(body) if orjson else json.dumps(body).encode()
 
 def extract(field, pull:str):
     if isinstance(field, str):
@@ -17,6 +53,21 @@ def extract(field, pull:str):
         return field.get(pull)
     return None
 
+def pluck(series: pd.Series, pull: str) -> pd.api.extensions.ExtensionArray:
+    """
+    Extract one field from every element of a Series of dicts straight into a string array.
+
+    Dicts are read directly; anything else (JSON strings, nulls) falls back to `extract`.
+
+    Parameters:
+    - series: Series of dicts, JSON strings or nulls
+    - pull: field name to extract
+
+    Returns:
+    - Arrow string array aligned to `series`
+    """
+    return pd.array([d.get(pull) if isinstance(d, dict) else extract(d, pull) for d in series.values], dtype=_STRING_DTYPE)
+
 def extract_fields(data, fields):
     """
     Extract specified fields from a dictionary, JSON string, or list of dictionaries.
@@ -48,6 +99,70 @@ def extract_fields(data, fields):
 
     return None
 
+def flattened(df: pd.DataFrame, column: str) -> pd.Series:
+    """
+    Return a column produced by `pd.json_normalize`, or an all-null Series if no row carried the nested field.
+
+    Parameters:
+    - df: DataFrame built with `pd.json_normalize(..., sep="_")`
+    - column: flattened column name, e.g. "materialGroup_externalId"
+
+    Returns:
+    - pd.Series aligned to `df.index`
+    """
+    if column in df.columns:
+        return df[column]
+    return pd.Series(None, index=df.index, dtype="object")
+
+def to_df(records, flatten: bool = False) -> pd.DataFrame:
+    """
+    Build a DataFrame from API records using PyArrow-backed dtypes.
+
+    Parameters:
+    - records: list of dicts as returned by the scheduler API
+    - flatten: if True, nested objects are flattened via `pd.json_normalize(..., sep="_")`
+
+    Returns:
+    - pd.DataFrame with Arrow dtypes; columns holding dicts or lists stay object
+    """
+    data = pd.json_normalize(records, sep="_") if flatten else pd.DataFrame(records)
+    data = data.convert_dtypes(dtype_backend="pyarrow")
+
+    # all-null columns come back as the Arrow null type, which cannot hold any filled value
+    null_columns = {c: object for c, t in data.dtypes.items() if t == pd.ArrowDtype(pa.null())}
+    return data.astype(null_columns)
+
+def fill_blank(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Replace nulls with '' across a DataFrame.
+
+    Arrow numeric and boolean columns cannot hold '', so every non-string column is cast to object first.
+
+    Parameters:
+    - df: the DataFrame to fill
+
+    Returns:
+    - pd.DataFrame with nulls replaced by ''
+    """
+    non_string = {c: object for c, t in df.dtypes.items() if not pd.api.types.is_string_dtype(t)}
+    return df.astype(non_string).fillna('')
+
+def shared_categories(*columns: pd.Series) -> pd.CategoricalDtype:
+    """
+    Build one sorted CategoricalDtype covering every non-null value of the given columns.
+
+    Casting all sides of a join to the same dtype lets pandas merge on the integer codes
+    instead of hashing and comparing strings.
+
+    Parameters:
+    - columns: the Series whose values must all be representable
+
+    Returns:
+    - pd.CategoricalDtype
+    """
+    values = pd.concat(columns, ignore_index=True).dropna().drop_duplicates().sort_values()
+    return pd.CategoricalDtype(categories=values.tolist())
+
 class TilliT:
 
     _schedulerEndpoints = {
@@ -60,13 +175,49 @@ class TilliT:
         "segment_materials": "/segment-materials",
     }
 
-    _scheduler_priority_map = {
+    # source columns scheduler_get_bom_setup joins on or reads; everything else is dropped before merging
+    _bomColumns = [
+        "operationCode", "routeCode", "segmentCode", "externalId", "description", "materialGroup", "quantity", "route",
+        "equipmentClass", "materialDefinition", "quantityUnitOfMeasure", "materialUse", "fixedDuration", "rate",
+    ]
+
+    # GraphQL documents, sent as persisted-query hashes where the server supports it. They are
+    # fixed strings; per-call values go in "variables" so the server can reuse the parsed query.
+    _schedulerQueries = {
+        "scenarios": """query Scenarios($code: String!) { scenarios(where: { isLive: true, location: { code: $code } }) { id dataTemplate { id }}}""",
+        "equipments": """query equipments($where: FilterEquipmentInput!, $orderBy: [String]) {  equipments(where: $where, orderBy: $orderBy) {    id    externalId    description  }}""",
+        "orders": """query orders($scenarioId: Int!, $ids: [Int]!) {  getOrdersForScenario(scenarioId: $scenarioId, ids: $ids) {    id    externalId    earliestStartDate    dueDate    priority    notes    status {      status      alias      code    }    orderItems {      id      invalid      invalidReason      allocated      quantity      quantityUnitOfMeasure      operationsDefinitionClass    }    orderProperties {      externalId      value    }  }}""",
+        "getAllocations": """query getAllocations($scenarioId: Int!, $fromDate: String, $toDate: String) {  getAllocations(scenarioId: $scenarioId, fromDate: $fromDate, toDate: $toDate) {    version    allocations {      id      profileId      start      end      segmentId      orderItemId      quantity      duration      expectedDuration      durationLocked      assignments {        id        resourceId        resourceType        requirementId      }      allocatedPeriods {        start        end      }      changeover {        id        profileId        start        end        segmentId        orderItemId        quantity        duration        expectedDuration        durationLocked        linkedSegmentId        assignments {          id          resourceId          resourceType          requirementId        }        allocatedPeriods {          start          end        }      }    }  }}""",
+    }
+
+    _schedulerQueryHashes = {q: hashlib.sha256(q.encode()).hexdigest() for q in _schedulerQueries.values()}
+
+    # response cache lifetimes in seconds, by policy class
+    _cacheTTL = {
+        "short": 10,
+        "normal": 30,
+        "long": 60,
+    }
+
+    # cache policy per scheduler endpoint or GraphQL operationName; anything else is "normal"
+    _schedulerCachePolicy = {
+        "/operations": "long",
+        "/routes": "long",
+        "/material-definitions": "long",
+        "/material-properties": "long",
+        "/segments": "long",
+        "/segment-equipments": "long",
+        "/segment-materials": "long",
+        "equipments": "long",
+        "orders": "short",
+        "getAllocations": "short",
+    }
+
+    _scheduler_priority_map = MappingProxyType({
         1: 'High',
         2: 'Medium',
         3: 'Low',
-    }
-
-    _schedulerStartDateEpoch = datetime(1970, 1, 1, 0, 0, 0, 0)
+    })
 
     def __init__(self, site: str, tenant: str, authBase64: str,  isStage: bool = False):
         self._site = site
@@ -81,6 +232,16 @@ class TilliT:
             "Content-Type": "application/json"
         }
 
+        self._cache: dict[str, tuple[float, dict]] = {}
+        self._persistedQueries = True
+        self._equipmentCache = None
+
+        # keep-alive connection pool shared by every fetch on this instance
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]))
+        self._session.mount("https://", adapter)
+
         self._set_data_template()
 
         if self._scheduler_data_id > 0 and self._scheduler_scenario_id > 0:
@@ -108,10 +269,15 @@ class TilliT:
         Returns:
             bool: True if both IDs are successfully retrieved and greater than zero, False otherwise.
         """
-        payload = """query Scenarios { scenarios(where: { isLive: true, location: { code: "SiteCode" } }) { id dataTemplate { id }}}"""
+        payload = {
+            "operationName": "Scenarios",
+            "variables": {
+                "code": self._site
+            },
+            "query": self._schedulerQueries["scenarios"]
+        }
 
-        payload = payload.replace('SiteCode',self._site)
-        data = self.fetch_scheduler_graphql({"query": payload})
+        data = self._fetch_scheduler_graphql(payload)
         scenario = data["data"]["scenarios"][0]
 
         self._scheduler_data_id = int(scenario["dataTemplate"]["id"] if data else 0)
@@ -119,34 +285,137 @@ class TilliT:
 
         return self._scheduler_data_id > 0 and self._scheduler_scenario_id >0
 
+    def _cached(self, key: str, ttl: float, fn, cacheable=None):
+        """
+        Returns the cached result for `key` if it is younger than `ttl` seconds, otherwise calls `fn`
+        and caches its result.
+
+        Args:
+            key (str): The cache key.
+            ttl (float): The maximum age in seconds of a cached result.
+            fn (callable): A zero-argument function producing the result on a cache miss.
+            cacheable (callable, optional): Called with a fresh result; it is only cached if this returns True.
+
+        Returns:
+            The cached or freshly fetched result.
+        """
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit and now - hit[0] < ttl:
+            return hit[1]
+
+        result = fn()
+        if cacheable is None or cacheable(result):
+            self._cache[key] = (now, result)
+        return result
+
+    def _cache_key(self, url: str, payload=None) -> str:
+        return hashlib.md5((url + json.dumps(payload, sort_keys=True)).encode()).hexdigest()
+
+    def _cache_ttl(self, name: str) -> float:
+        return self._cacheTTL[self._schedulerCachePolicy.get(name, "normal")]
+
+    def clear_cache(self) -> None:
+        """Discard all cached scheduler responses, including the per-instance equipment metadata."""
+        self._cache.clear()
+        self._equipmentCache = None
+
+    def _query_hash(self, query: str) -> str:
+        digest = self._schedulerQueryHashes.get(query)
+        return digest if digest else hashlib.sha256(query.encode()).hexdigest()
+
     def fetch_scheduler_graphql(self, payload) ->  dict:
+        """
+        Sends a POST request to the scheduler GraphQL API and returns the JSON response.
+
+        Queries are sent as Automatic Persisted Queries (a SHA-256 hash of the document), with the full
+        document sent only when the server has not seen it yet or does not support persisted queries.
+        Successful responses are cached for a short period, depending on the query's `operationName`.
+
+        Args:
+            payload (dict): The GraphQL request body (query, operationName, variables).
+
+        Returns:
+            dict: The JSON response from the scheduler GraphQL API. This is a copy of the cached response,
+                so callers may modify it.
+        """
+        return copy.deepcopy(self._fetch_scheduler_graphql(payload))
+
+    def _fetch_scheduler_graphql(self, payload: dict) -> dict:
+        # the cached response itself, shared by every hit within the TTL; callers must not modify it
         url = self._baseURLSchedulerGraphQL
-        response = requests.post(url, headers=self._headers, json=payload)
-        response.raise_for_status()
-        return response.json()
 
-    def fetch_scheduler(self, endpoint: str) ->  dict:
+        def post(body: dict) -> dict:
+            # the session already sends Content-Type: application/json
+            return read_json(self._session.post(url, data=write_json(body)))
+
+        def fetch():
+            query = payload.get("query")
+            if not self._persistedQueries or not query:
+                return post(payload)
+
+            # send only the document hash; the full text is sent when the server does not know it yet
+            extensions = {"persistedQuery": {"version": 1, "sha256Hash": self._query_hash(query)}}
+            body = {k: v for k, v in payload.items() if k != "query"}
+            try:
+                data = post({**body, "extensions": extensions})
+            except requests.HTTPError:
+                # servers without persisted query support reject a request that has no query (400, 422, 500, ...)
+                self._persistedQueries = False
+                return post(payload)
+
+            errors = {(error.get("extensions") or {}).get("code") or error.get("message") for error in data.get("errors") or []}
+            if errors & {"PERSISTED_QUERY_NOT_SUPPORTED", "PersistedQueryNotSupported"}:
+                self._persistedQueries = False
+                return post(payload)
+            if errors & {"PERSISTED_QUERY_NOT_FOUND", "PersistedQueryNotFound"}:
+                return post({**payload, "extensions": extensions})
+            if errors and data.get("data") is None:
+                # a server that ignores the extension fails with a generic error (e.g. empty query).
+                # Stop sending hashes after this one round-trip, so a genuinely failing query is not
+                # sent twice on every call.
+                self._persistedQueries = False
+                return post(payload)
+            return data
+
+        # error responses are returned to the caller but never cached
+        return self._cached(self._cache_key(url, payload), self._cache_ttl(payload.get("operationName")), fetch,
+                            cacheable=lambda data: not data.get("errors"))
+
+    def fetch_scheduler(self, endpoint: str, flatten: bool = False) -> Union[dict, pd.DataFrame]:
         """
         Sends a GET request to the scheduler API for the specified endpoint and returns the JSON response.
 
         This method constructs the full URL using the scheduler base URL and appends pagination parameters
         to retrieve a large dataset in one request. It raises an exception if the request fails.
+        Responses are cached for a short period, depending on the endpoint.
 
         Args:
             endpoint (str): The relative endpoint path to query from the scheduler API.
+            flatten (bool): If True, returns the response as a DataFrame (see `to_df`) with nested objects
+                flattened into `parent_child` columns (e.g. `materialGroup_externalId`).
 
         Returns:
-            dict: The JSON response from the scheduler API.
+            dict | pd.DataFrame: The JSON response from the scheduler API. This is a copy of the cached
+                response, so callers may modify it.
         """
-        
+        data = self._fetch_scheduler(endpoint)
+
+        if flatten:
+            return to_df(data, flatten=True)
+        return copy.deepcopy(data)
+
+    def _fetch_scheduler(self, endpoint: str) -> dict:
+        # the cached response itself, shared by every hit within the TTL; callers must not modify it
         url = f"{self._baseURLScheduler}{endpoint}"
 
         # avoid pagination
         url =f"{url}{'&' if ('?' in url) else '?'}page=0&size=100000&sort=id,asc"
 
-        response = requests.get(url, headers=self._headers)
-        response.raise_for_status()
-        return response.json()
+        def fetch():
+            return read_json(self._session.get(url))
+
+        return self._cached(self._cache_key(url), self._cache_ttl(endpoint), fetch)
 
     def fetch_DO(self, endpoint: str) -> dict:
         """
@@ -167,9 +436,7 @@ class TilliT:
         # avoid pagination
         url =f"{url}{'&' if ('?' in url) else '?'}page=0&size=100000&sort=id,asc"
 
-        response = requests.get(url, headers=self._headers)
-        response.raise_for_status()
-        return response.json()
+        return read_json(self._session.get(url))
 
     def _scheduler_get_operations(self) -> pd.DataFrame:
         """
@@ -178,7 +445,7 @@ class TilliT:
         Returns:
             pd.DataFrame: A DataFrame containing operations data.
         """
-        return pd.DataFrame(self.fetch_scheduler(self._schedulerEndpoints["operations"]))
+        return to_df(self._fetch_scheduler(self._schedulerEndpoints["operations"]))
 
     def _scheduler_get_routes(self) -> pd.DataFrame:
         """
@@ -187,7 +454,7 @@ class TilliT:
         Returns:
             pd.DataFrame: A DataFrame containing route definitions.
         """
-        return pd.DataFrame(self.fetch_scheduler(self._schedulerEndpoints["routes"]))
+        return to_df(self._fetch_scheduler(self._schedulerEndpoints["routes"]))
 
     def _scheduler_get_equipment(self) -> pd.DataFrame:
         """
@@ -204,8 +471,6 @@ class TilliT:
             - description: Textual description of the equipment
 
         """
-        payload = """query equipments($where: FilterEquipmentInput!, $orderBy: [String]) {  equipments(where: $where, orderBy: $orderBy) {    id    externalId    description  }}"""
-
         payload = {
             "operationName": "equipments",
             "variables": {
@@ -215,14 +480,25 @@ class TilliT:
                     }
                 }
             },
-            "query": payload}
+            "query": self._schedulerQueries["equipments"]}
 
-        data = self.fetch_scheduler_graphql(payload)["data"]["equipments"]
+        data = self._fetch_scheduler_graphql(payload)["data"]["equipments"]
 
         if data == None:
             return None
-        data = pd.DataFrame(data)
+        data = to_df(data)
         return data.sort_values(by="externalId").reset_index(drop=True)
+
+    @property
+    def _equipment(self) -> pd.DataFrame:
+        """
+        Equipment metadata from `_scheduler_get_equipment`, fetched once per instance.
+
+        Equipment does not change during a scheduling session; call `clear_cache` to refetch it.
+        """
+        if self._equipmentCache is None:
+            self._equipmentCache = self._scheduler_get_equipment()
+        return self._equipmentCache
     
     def _scheduler_get_materials(self, includeProperties:bool=False) -> pd.DataFrame:
         """
@@ -231,16 +507,14 @@ class TilliT:
         Returns:
             pd.DataFrame: A DataFrame containing material definitions.
         """
-        data = pd.DataFrame(self.fetch_scheduler(self._schedulerEndpoints["material_definitions"]))
-        data["materialGroup"] = data["materialGroup"].apply(lambda x: extract(x, "externalId")).astype("string")
-        data["externalId"] = data["externalId"].astype("string")
-        data["description"] = data["description"].astype("string")
+        data = self.fetch_scheduler(self._schedulerEndpoints["material_definitions"], flatten=True)
+        data["materialGroup"] = flattened(data, "materialGroup_externalId")
 
         selected_columns = ["externalId", "description", "materialGroup"]
         data = data[selected_columns]
 
         if not includeProperties:
-            return data.fillna('')
+            return fill_blank(data)
 
         props = self._scheduler_get_materials_properties()
 
@@ -248,7 +522,7 @@ class TilliT:
             .merge(props, how="left", left_on="externalId", right_on="productCode") \
             .drop("productCode", axis=1)
 
-        return merged_df.reset_index(drop=True).fillna('')
+        return fill_blank(merged_df.reset_index(drop=True))
     
     def _scheduler_get_materials_properties(self) -> pd.DataFrame:
         """
@@ -257,13 +531,19 @@ class TilliT:
         Returns:
             pd.DataFrame: A DataFrame containing material definitions.
         """
-        data = pd.DataFrame(self.fetch_scheduler(self._schedulerEndpoints["materials_properties"]))
-        data["productCode"] = data["materialDefinition"].apply(lambda x: extract(x, "externalId"))
-        data["productCode"] = data["productCode"].astype("string")
-        
-        data = data.pivot(index='productCode', columns='externalId', values='value').reset_index()
+        data = self.fetch_scheduler(self._schedulerEndpoints["materials_properties"], flatten=True)
+        data["productCode"] = flattened(data, "materialDefinition_externalId").astype("category")
+        data["externalId"] = data["externalId"].astype("category")
+        # values are mixed text and numbers across properties; keep them as plain objects so the pivot stays untyped
+        data["value"] = data["value"].astype(object)
 
-        data = data.fillna('')
+        # categorical keys let the pivot work on integer codes; dropna=False keeps all-empty properties like pivot did
+        data = data.pivot_table(index='productCode', columns='externalId', values='value', aggfunc='first', observed=True, dropna=False)
+        data.index = data.index.astype(_STRING_DTYPE)
+        data.columns = data.columns.astype(object)
+        data = data.reset_index()
+
+        data = fill_blank(data)
 
         return data.reset_index(drop=True)
 
@@ -274,7 +554,7 @@ class TilliT:
         Returns:
             pd.DataFrame: A DataFrame containing segment information.
         """
-        return pd.DataFrame(self.fetch_scheduler(self._schedulerEndpoints["segments"]))
+        return to_df(self._fetch_scheduler(self._schedulerEndpoints["segments"]))
 
     def _scheduler_get_equipments(self) -> pd.DataFrame:
         """
@@ -283,7 +563,7 @@ class TilliT:
         Returns:
             pd.DataFrame: A DataFrame containing segment equipment data.
         """
-        return pd.DataFrame(self.fetch_scheduler(self._schedulerEndpoints["segment_equipments"]))
+        return to_df(self._fetch_scheduler(self._schedulerEndpoints["segment_equipments"]))
 
     def _scheduler_get_segment_materials(self) -> pd.DataFrame:
         """
@@ -292,7 +572,7 @@ class TilliT:
         Returns:
             pd.DataFrame: A DataFrame containing segment-material relationships.
         """
-        return pd.DataFrame(self.fetch_scheduler(self._schedulerEndpoints["segment_materials"]))
+        return to_df(self._fetch_scheduler(self._schedulerEndpoints["segment_materials"]))
 
     def _scheduler_get_planned_order(self, excludeCompleted:bool = False, excludeItems:list[str] = []) -> pd.DataFrame:
         """
@@ -314,36 +594,38 @@ class TilliT:
         - This method does not apply filtering directly in the GraphQL query; filtering based on `excludeCompleted` and `excludeItems` is expected to be applied after fetching.
         """
 
-        payload = """query orders($scenarioId: Int!, $ids: [Int]!) {  getOrdersForScenario(scenarioId: $scenarioId, ids: $ids) {    id    externalId    earliestStartDate    dueDate    priority    notes    status {      status      alias      code    }    orderItems {      id      invalid      invalidReason      allocated      quantity      quantityUnitOfMeasure      operationsDefinitionClass    }    orderProperties {      externalId      value    }  }}"""
-
         payload = {
             "operationName": "orders",
             "variables": {
                 "scenarioId": self._scheduler_scenario_id,
                 "ids": []
             },
-            "query": payload
+            "query": self._schedulerQueries["orders"]
         }
 
-        data = self.fetch_scheduler_graphql(payload)["data"]["getOrdersForScenario"]
+        data = self._fetch_scheduler_graphql(payload)["data"]["getOrdersForScenario"]
 
         if data == None:
             return None
-        data = pd.DataFrame(data)
+        # flattens status into status_status etc.; orderItems/orderProperties stay as lists
+        data = to_df(data, flatten=True)
 
-        data['status'] = data['status'].apply(lambda x: extract(x, 'status'))
+        data['status'] = flattened(data, 'status_status')
         data['orderItems'] = data['orderItems'].apply(lambda x: extract_fields(x, ["id", "quantity", "quantityUnitOfMeasure","operationsDefinitionClass"]))
 
-        data['orderItemsId'] = data['orderItems'].apply(lambda x: x[0]['id'] if x else None).astype(np.int64)
-        data['orderedQuantity'] = data['orderItems'].apply(lambda x: x[0]['quantity'] if x else None)
-        data['orderUOM'] = data['orderItems'].apply(lambda x: x[0]['quantityUnitOfMeasure'] if x else None)
-        data['ProductCode'] = data['orderItems'].apply(lambda x: x[0]['operationsDefinitionClass'].split(' - ')[0] if x else None)
+        # materialize the first order item of every order in one pass
+        # explicit string dtypes: when no order has an item the reindexed columns would be all-NaN floats
+        first = to_df([x[0] if x else {} for x in data['orderItems']]) \
+            .reindex(columns=["id", "quantity", "quantityUnitOfMeasure", "operationsDefinitionClass"]) \
+            .astype({"quantityUnitOfMeasure": _STRING_DTYPE, "operationsDefinitionClass": _STRING_DTYPE})
+
+        data['orderItemsId'] = pd.to_numeric(first['id']).astype('Int64')
+        data['orderedQuantity'] = first['quantity']
+        data['orderUOM'] = first['quantityUnitOfMeasure']
+        # same as split(' - ')[0], but stays a string column under the Arrow backend
+        data['ProductCode'] = first['operationsDefinitionClass'].str.replace(r'(?s) - .*', '', regex=True)
         data['orderProperties'] = data['orderProperties'].apply(lambda x: extract_fields(x, ["externalId", "value"]) if pd.notna(x).any() else None)
-        data['priority'] = data['priority'].apply(lambda x: self._scheduler_priority_map.get(x, ''))
-
-        data['ProductCode']= data['ProductCode'].astype("string")
-        data['notes']= data['notes'].astype("string")
-        data['externalId']= data['externalId'].astype("string")
+        data['priority'] = data['priority'].map(self._scheduler_priority_map).fillna('').astype(_STRING_DTYPE)
 
         selected_columns = ["id", "externalId", "earliestStartDate", "dueDate", "notes", "status", "orderItems", "orderProperties", "priority","orderItemsId", "orderedQuantity", "orderUOM", "ProductCode"]
 
@@ -365,8 +647,6 @@ class TilliT:
         Returns:
         - pd.DataFrame: A DataFrame containing scheduling information for each order item, including start/end times, scheduled quantity, duration, changeover time, and equipment used.
         """
-        payload = """query getAllocations($scenarioId: Int!, $fromDate: String, $toDate: String) {  getAllocations(scenarioId: $scenarioId, fromDate: $fromDate, toDate: $toDate) {    version    allocations {      id      profileId      start      end      segmentId      orderItemId      quantity      duration      expectedDuration      durationLocked      assignments {        id        resourceId        resourceType        requirementId      }      allocatedPeriods {        start        end      }      changeover {        id        profileId        start        end        segmentId        orderItemId        quantity        duration        expectedDuration        durationLocked        linkedSegmentId        assignments {          id          resourceId          resourceType          requirementId        }        allocatedPeriods {          start          end        }      }    }  }}"""
-
         payload = {
             "operationName":"getAllocations",
             "variables":{
@@ -374,26 +654,35 @@ class TilliT:
                     "fromDate": None
                     ,"toDate": None
             },
-            "query": payload
+            "query": self._schedulerQueries["getAllocations"]
         }
 
-        data = self.fetch_scheduler_graphql(payload)["data"]["getAllocations"]["allocations"]
+        if self._equipmentCache is None:
+            # equipment metadata does not depend on the allocations, so fetch it alongside
+            with ThreadPoolExecutor(max_workers=1) as ex:
+                equipmentFut = ex.submit(lambda: self._equipment)
+                data = self._fetch_scheduler_graphql(payload)["data"]["getAllocations"]["allocations"]
+            equipment = equipmentFut.result()
+        else:
+            data = self._fetch_scheduler_graphql(payload)["data"]["getAllocations"]["allocations"]
+            equipment = self._equipment
 
         if data == None:
             return None
         
-        data = pd.DataFrame(data)
-
-        equipment = self._scheduler_get_equipment()
+        data = to_df(data)
         
-        data["StartDateTime"] = data["start"].apply(lambda x: self._schedulerStartDateEpoch + timedelta(seconds = int(x)/1000))
-        data["EndDateTime"] = data["end"].apply(lambda x: self._schedulerStartDateEpoch + timedelta(seconds = int(x)/1000))
+        # start/end are Unix epoch milliseconds
+        data["StartDateTime"] = pd.to_datetime(pd.to_numeric(data["start"], errors="coerce"), unit="ms")
+        data["EndDateTime"] = pd.to_datetime(pd.to_numeric(data["end"], errors="coerce"), unit="ms")
 
         data["Changeover_duration"] = data["changeover"].apply(lambda x: extract(x, "duration"))
         
-        data["resourceIds"] = data["assignments"].apply(lambda x: [item["resourceId"] for item in x])
-        data["Equipment"] = data["resourceIds"].apply(lambda x: equipment[equipment["id"].isin(x)]["externalId"].tolist())
-        data["Equipment"] = data["Equipment"].apply(lambda x: ','.join(x) if x else None)
+        # one name per distinct resource id (two ids may share an externalId), sorted to keep
+        # the externalId order the equipment lookup is returned in
+        id_to_ext = dict(zip(equipment["id"], equipment["externalId"]))
+        data["Equipment"] = data["assignments"].map(
+            lambda x: ','.join(sorted(id_to_ext[i] for i in {item["resourceId"] for item in x} if i in id_to_ext)) or None)
         data['orderItemId'] = data['orderItemId'].astype(np.int64)        
 
         selected_columns = ["orderItemId", "StartDateTime", "EndDateTime", "quantity", "duration", "expectedDuration", "durationLocked", "Changeover_duration", "Equipment"]
@@ -402,30 +691,28 @@ class TilliT:
                     "quantity":"ScheduledQuantity",
                 }).reset_index(drop=True)
 
-    def _do_get_completed_orders(self, orderNumbers: list[str]) -> list[str]:
+    def _do_get_completed_orders(self, orderNumbers: Iterable[str]) -> frozenset[str]:
         """
-        Retrieves a list of completed order numbers from the external order instance API.
+        Retrieves the completed order numbers from the external order instance API.
 
         Args:
-            orderNumbers (list[str]): A list of order numbers to check for completion status.
+            orderNumbers (Iterable[str]): The order numbers to check for completion status (e.g. a Series).
 
         Returns:
-            list[str]: A list of unique order numbers that have a status of 'COMPLETED'.
+            frozenset[str]: The order numbers that have a status of 'COMPLETED'.
         """
-        orders: List[str] = []
-
-        batches = [orderNumbers[i:i + 80] for i in range(0, len(orderNumbers), 80)]
-        for batch in batches:
+        it = iter(orderNumbers)
+        batches = list(iter(lambda: list(islice(it, 80)), []))
 
-            orderList = ",".join(batch)
-            response = self.fetch_DO(endpoint=f"core/order-instances?status.equals=COMPLETED&orderNumber.in={orderList}")
+        def fetch(batch: list[str]) -> list:
+            orderList = ",".join(map(str, batch))
+            return self.fetch_DO(endpoint=f"core/order-instances?status.equals=COMPLETED&orderNumber.in={orderList}")
 
-            df = pd.DataFrame(response)
+        # the batches are independent, so query them concurrently
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            responses = list(ex.map(fetch, batches))
 
-            if "orderNumber" in df.columns:
-                orders += df["orderNumber"].unique().tolist()
-
-        return list(set(orders))
+        return frozenset(item["orderNumber"] for response in responses for item in response if "orderNumber" in item)
 
 #Exposed Functions
     
@@ -445,53 +732,86 @@ class TilliT:
             pd.DataFrame: A cleaned and structured DataFrame representing the BOM setup, ready for analysis or export.
         """
 
-        operations_df = self._scheduler_get_operations()
-        routes_df = self._scheduler_get_routes()
-        materials_df = self._scheduler_get_materials()
-        segments_df = self._scheduler_get_segments()
-        equipments_df = self._scheduler_get_equipments()
-        segment_materials_df = self._scheduler_get_segment_materials()
+        # each source is an independent round-trip, so fetch them concurrently
+        sources = {
+            "operations": self._scheduler_get_operations,
+            "routes": self._scheduler_get_routes,
+            "materials": self._scheduler_get_materials,
+            "segments": self._scheduler_get_segments,
+            "equipments": self._scheduler_get_equipments,
+            "segment_materials": self._scheduler_get_segment_materials,
+        }
+        with ThreadPoolExecutor(max_workers=len(sources)) as ex:
+            futs = {name: ex.submit(fn) for name, fn in sources.items()}
+
+        operations_df = futs["operations"].result()
+        routes_df = futs["routes"].result()
+        materials_df = futs["materials"].result()
+        segments_df = futs["segments"].result()
+        equipments_df = futs["equipments"].result()
+        segment_materials_df = futs["segment_materials"].result()
+
+        # only carry the needed columns through the merges; every source keeps all of them it has,
+        # so colliding names are suffixed exactly as before (e.g. quantity_segmentMaterial)
+        operations_df, routes_df, materials_df, segments_df, equipments_df, segment_materials_df = [
+            df.filter(items=self._bomColumns)
+            for df in (operations_df, routes_df, materials_df, segments_df, equipments_df, segment_materials_df)
+        ]
+
+        # give every side of each join key the same categorical dtype so the merges compare codes
+        frames = [operations_df, routes_df, materials_df, segments_df, equipments_df, segment_materials_df]
+        for key in ("operationCode", "routeCode", "segmentCode"):
+            targets = [(df, key) for df in frames if key in df.columns]
+            if key == "operationCode":
+                targets.append((materials_df, "externalId"))
+
+            dtype = shared_categories(*[df[c] for df, c in targets])
+            for df, c in targets:
+                df[c] = df[c].astype(dtype)
 
         merged_df = operations_df \
-        .merge(routes_df, how="left", left_on="operationCode", right_on="operationCode", suffixes=('', '_route')) \
-        .merge(materials_df, how="left", left_on="operationCode", right_on="externalId", suffixes=('', '_material')) \
-        .merge(segments_df, how="left", left_on=["operationCode","routeCode"], right_on=["operationCode","routeCode"], suffixes=('', '_segments')) \
-        .merge(equipments_df, how="left", left_on=["operationCode","routeCode","segmentCode"], right_on=["operationCode","routeCode","segmentCode"], suffixes=('', '_equipment')) \
-        .merge(segment_materials_df, how="left", left_on=["operationCode","routeCode","segmentCode"], right_on=["operationCode","routeCode","segmentCode"], suffixes=('', '_segmentMaterial')) 
+        .merge(routes_df, how="left", left_on="operationCode", right_on="operationCode", suffixes=('', '_route'), sort=False) \
+        .merge(materials_df, how="left", left_on="operationCode", right_on="externalId", suffixes=('', '_material'), sort=False) \
+        .merge(segments_df, how="left", left_on=["operationCode","routeCode"], right_on=["operationCode","routeCode"], suffixes=('', '_segments'), sort=False) \
+        .merge(equipments_df, how="left", left_on=["operationCode","routeCode","segmentCode"], right_on=["operationCode","routeCode","segmentCode"], suffixes=('', '_equipment'), sort=False) \
+        .merge(segment_materials_df, how="left", left_on=["operationCode","routeCode","segmentCode"], right_on=["operationCode","routeCode","segmentCode"], suffixes=('', '_segmentMaterial'), sort=False) 
 
         selected_columns = ["quantity", "operationCode", "externalId", "description", "materialGroup", "segmentCode", "route", "equipmentClassId"
                 ,"equipmentClass","materialId","material","quantity_segmentMaterial"
                 ,"quantityUnitOfMeasure","materialUse","fixedDuration", "rate","rateHour"
         ]
 
-        merged_df['route'] = merged_df['route'].apply(lambda x: extract(x, 'routeCode'))
-        merged_df['equipmentClassId'] = merged_df['equipmentClass'].apply(lambda x: extract(x, 'externalId'))
-        merged_df['equipmentClass'] = merged_df['equipmentClass'].apply(lambda x: extract(x, 'description')).replace(["NaN", "null", "", np.nan, None], '')
-        merged_df['materialId'] = merged_df['materialDefinition'].apply(lambda x: extract(x, 'externalId'))
-        merged_df['material'] = merged_df['materialDefinition'].apply(lambda x: extract(x, 'description'))
-        merged_df["fixedDuration"] = pd.to_numeric(merged_df["fixedDuration"].replace(["NaN", "null", "", np.nan], 0),errors='coerce')
-        merged_df["rate"] = pd.to_numeric(merged_df["rate"].replace(["NaN", "null", "", np.nan], 0),errors='coerce')
+        merged_df['route'] = pluck(merged_df['route'], 'routeCode')
+        merged_df['equipmentClassId'] = pluck(merged_df['equipmentClass'], 'externalId')
+        equipmentClass = pd.Series(pluck(merged_df['equipmentClass'], 'description'), index=merged_df.index)
+        merged_df['equipmentClass'] = equipmentClass.mask(equipmentClass.isin(_STRING_SENTINELS) | equipmentClass.isna(), '')
+        merged_df['materialId'] = pluck(merged_df['materialDefinition'], 'externalId')
+        merged_df['material'] = pluck(merged_df['materialDefinition'], 'description')
+        # coerce first: the sources may carry these as Arrow strings, which cannot take a numeric 0
+        merged_df["fixedDuration"] = pd.to_numeric(merged_df["fixedDuration"], errors='coerce').fillna(0)
+        merged_df["rate"] = pd.to_numeric(merged_df["rate"], errors='coerce').fillna(0)
         merged_df["rateHour"] = (merged_df["rate"] *60 *60)
 
-        # before returning we should set the datatypes.
-        merged_df = merged_df.astype({         
-            "operationCode": "string",
-            "externalId": "string",
-            "description": "string",
-            "materialGroup": "string",
-            "segmentCode": "string",
-            "route": "string",
-            "quantity": "float",
-            "quantity_segmentMaterial": "float",
-            "quantityUnitOfMeasure": "string",
-            "materialUse": "string",
-            "equipmentClass": "string",
-            "equipmentClassId": "string",
-            "materialId": "string",
-            "material": "string",
-            "fixedDuration": "float",
-            "rate": "float",
-            "rateHour": "float"
+        # before returning we should set the datatypes; columns that were null for every row
+        # (and the categorical join keys) would otherwise not come back as strings.
+        merged_df = merged_df.astype({
+            "operationCode": _STRING_DTYPE,
+            "externalId": _STRING_DTYPE,
+            "description": _STRING_DTYPE,
+            "materialGroup": _STRING_DTYPE,
+            "segmentCode": _STRING_DTYPE,
+            "route": _STRING_DTYPE,
+            "quantity": "float64[pyarrow]",
+            "quantity_segmentMaterial": "float64[pyarrow]",
+            "quantityUnitOfMeasure": _STRING_DTYPE,
+            "materialUse": _STRING_DTYPE,
+            "equipmentClass": _STRING_DTYPE,
+            "equipmentClassId": _STRING_DTYPE,
+            "materialId": _STRING_DTYPE,
+            "material": _STRING_DTYPE,
+            "fixedDuration": "float64[pyarrow]",
+            "rate": "float64[pyarrow]",
+            "rateHour": "float64[pyarrow]"
         })
             
         merged_df = merged_df[selected_columns].rename(columns={
@@ -542,18 +862,21 @@ class TilliT:
         - pd.DataFrame: A merged DataFrame containing detailed information about planned and scheduled orders.
         """
 
-        plannedOrders = self._scheduler_get_planned_order(excludeCompleted=excludeCompleted, excludeItems=excludeItems)
-        scheduledOrder = self._scheduler_get_scheduled_order()
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            plannedFut = ex.submit(self._scheduler_get_planned_order, excludeCompleted=excludeCompleted, excludeItems=excludeItems)
+            scheduledFut = ex.submit(self._scheduler_get_scheduled_order)
+
+        plannedOrders = plannedFut.result()
+        scheduledOrder = scheduledFut.result()
 
         merged_df = plannedOrders \
             .merge(scheduledOrder, how="inner", left_on="orderItemsId", right_on="orderItemId", suffixes=('', '_scheduled'))
 
-        orderNumbers = merged_df["orderNumber"].unique().tolist() 
-        doOrders = self._do_get_completed_orders(orderNumbers=orderNumbers)
+        doOrders = self._do_get_completed_orders(orderNumbers=merged_df["orderNumber"].drop_duplicates())
 
         merged_df.loc[merged_df["orderNumber"].isin(doOrders), "status"] = "COMPLETED"
 
-        merged_df = merged_df.drop(columns=['orderItemId','orderItemsId'],axis=1)
+        merged_df = merged_df.drop(columns=['orderItemId','orderItemsId'])
         merged_df.columns = [
             'Id', 'OrderNumber', 'EarliestStartDate', 'DueDate', 'Notes', 'Status', 'OrderItems', 'OrderProperties', 'Priority', 
             'OrderedQuantity', 'OrderUOM', 'ProductCode', 'StartDateTime', 'EndDateTime', 'ScheduledQuantity', 'Duration_Minutes', 
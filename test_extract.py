@@ -0,0 +1,265 @@
+import json
+from unittest import mock
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+import requests
+
+from Extract import TilliT, pluck
+
+
+def make_response(body, status: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode()
+    return response
+
+
+REST_RESPONSES = {
+    "/operations": [
+        {"id": 1, "operationCode": "P1", "externalId": "P1", "description": "Product 1", "quantity": 10, "routeCode": "R1"},
+        {"id": 2, "operationCode": "P2", "externalId": "P2", "description": "Product 2", "quantity": 1, "routeCode": "R9"},
+    ],
+    "/routes": [{"id": 1, "operationCode": "P1", "routeCode": "R1", "route": {"routeCode": "R1"}}],
+    "/segments": [{"id": 1, "operationCode": "P1", "routeCode": "R1", "segmentCode": "S1"}],
+    "/segment-equipments": [
+        {"id": 1, "operationCode": "P1", "routeCode": "R1", "segmentCode": "S1",
+         "equipmentClass": {"externalId": "EC1", "description": "Line"}, "fixedDuration": "5", "rate": "0.5"},
+    ],
+    "/segment-materials": [
+        {"id": 1, "operationCode": "P1", "routeCode": "R1", "segmentCode": "S1",
+         "materialDefinition": {"externalId": "M1", "description": "Material 1"},
+         "quantity": 2, "quantityUnitOfMeasure": "kg", "materialUse": "Consumed"},
+    ],
+    "/material-definitions": [
+        {"id": 1, "externalId": "P1", "description": "Product 1", "materialGroup": {"externalId": "G1"}},
+        {"id": 2, "externalId": "M1", "description": "Material 1", "materialGroup": None},
+    ],
+    # numeric values only, and not every material has every property
+    "/material-properties": [
+        {"id": 1, "externalId": "weight", "value": 1.5, "materialDefinition": {"externalId": "P1"}},
+        {"id": 2, "externalId": "height", "value": 2, "materialDefinition": {"externalId": "M1"}},
+    ],
+}
+
+GRAPHQL_RESPONSES = {
+    "equipments": {"data": {"equipments": [
+        {"id": "11", "externalId": "EQA", "description": "Line A"},
+        {"id": "12", "externalId": "EQA", "description": "Line A (spare)"},
+        {"id": "13", "externalId": "EQB", "description": "Line B"},
+    ]}},
+    "orders": {"data": {"getOrdersForScenario": [
+        {"id": "1", "externalId": "O1", "earliestStartDate": "2024-01-01", "dueDate": "2024-01-02", "priority": 1,
+         "notes": None, "status": {"status": "PLANNED", "alias": "Planned", "code": "P"},
+         "orderItems": [{"id": "21", "quantity": 5, "quantityUnitOfMeasure": "ea", "operationsDefinitionClass": "P1 - Product 1"}],
+         "orderProperties": [{"externalId": "line", "value": "A"}]},
+        {"id": "2", "externalId": "O2", "earliestStartDate": "2024-01-01", "dueDate": "2024-01-03", "priority": 7,
+         "notes": "rush", "status": {"status": "PLANNED", "alias": "Planned", "code": "P"},
+         "orderItems": [{"id": "22", "quantity": 3, "quantityUnitOfMeasure": "ea", "operationsDefinitionClass": "P2 - Product 2"}],
+         "orderProperties": [{"externalId": "line", "value": "B"}]},
+    ]}},
+    "getAllocations": {"data": {"getAllocations": {"allocations": [
+        {"start": "1700000000000", "end": "1700003600000", "orderItemId": "21", "quantity": 5, "duration": 60,
+         "expectedDuration": 60, "durationLocked": False, "changeover": {"duration": 5},
+         "assignments": [{"resourceId": "11"}, {"resourceId": "12"}]},
+        {"start": "1700003600000", "end": "1700007200000", "orderItemId": "22", "quantity": 3, "duration": 60,
+         "expectedDuration": 60, "durationLocked": False, "changeover": None,
+         "assignments": [{"resourceId": "13"}]},
+    ]}}},
+}
+
+
+@pytest.fixture
+def tillit():
+    def set_data_template(self):
+        self._scheduler_data_id = 4
+        self._scheduler_scenario_id = 3
+        return True
+
+    with mock.patch.object(TilliT, "_set_data_template", set_data_template):
+        client = TilliT("SITE", "tenant", "auth")
+
+    def get(url, **kwargs):
+        if "/core/order-instances" in url:
+            return make_response([{"orderNumber": "O2", "status": "COMPLETED"}])
+        endpoint = "/" + url.split("/SITE/4/", 1)[1].split("?", 1)[0]
+        return make_response(REST_RESPONSES[endpoint])
+
+    def post(url, data=None, **kwargs):
+        body = json.loads(data)
+        if "query" not in body:
+            return make_response({"errors": [{"message": "PersistedQueryNotFound",
+                                              "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"}}]})
+        return make_response(GRAPHQL_RESPONSES[body["operationName"]])
+
+    client._session = mock.Mock(spec=requests.Session)
+    client._session.get.side_effect = get
+    client._session.post.side_effect = post
+    return client
+
+
+def test_materials_properties_numeric_values(tillit):
+    props = tillit._scheduler_get_materials_properties().set_index("productCode")
+
+    assert props.loc["P1", "weight"] == 1.5
+    assert props.loc["P1", "height"] == ''
+    assert props.loc["M1", "height"] == 2
+    assert props.loc["M1", "weight"] == ''
+
+
+def test_materials_with_numeric_properties(tillit):
+    materials = tillit.scheduler_get_materials(includeProperties=True).set_index("externalId")
+
+    assert materials.loc["P1", "weight"] == 1.5
+    assert materials.loc["P1", "height"] == ''
+    assert materials.loc["M1", "materialGroup"] == ''
+
+
+def ignores_persisted_queries(url, data=None, **kwargs):
+    body = json.loads(data)
+    if "query" not in body:
+        return make_response({"errors": [{"message": "query must not be empty"}], "data": None})
+    return make_response({"data": {"equipments": [{"id": "11", "externalId": "EQ1", "description": "Line 1"}]}})
+
+
+def test_graphql_resends_full_query_when_hash_is_ignored(tillit):
+    tillit._session.post.side_effect = ignores_persisted_queries
+    payload = {"operationName": "equipments", "variables": {}, "query": tillit._schedulerQueries["equipments"]}
+
+    data = tillit.fetch_scheduler_graphql(payload)
+
+    assert data["data"]["equipments"][0]["externalId"] == "EQ1"
+    assert tillit._persistedQueries is False
+
+
+def test_graphql_resends_full_query_when_hash_is_rejected(tillit):
+    def rejects_persisted_queries(url, data=None, **kwargs):
+        if "query" not in json.loads(data):
+            return make_response({"message": "Unprocessable Entity"}, status=422)
+        return ignores_persisted_queries(url, data=data, **kwargs)
+
+    tillit._session.post.side_effect = rejects_persisted_queries
+    payload = {"operationName": "equipments", "variables": {}, "query": tillit._schedulerQueries["equipments"]}
+
+    data = tillit.fetch_scheduler_graphql(payload)
+
+    assert data["data"]["equipments"][0]["externalId"] == "EQ1"
+    assert tillit._persistedQueries is False
+
+
+def test_graphql_query_error_is_resent_only_once(tillit):
+    tillit._session.post.side_effect = None
+    tillit._session.post.return_value = make_response({"errors": [{"message": "boom"}], "data": None})
+    payload = {"operationName": "equipments", "variables": {}, "query": tillit._schedulerQueries["equipments"]}
+
+    tillit.fetch_scheduler_graphql(payload)
+    tillit.fetch_scheduler_graphql(payload)
+
+    # hash-only + full query the first time, then only the full query
+    assert tillit._session.post.call_count == 3
+
+
+def test_graphql_errors_are_not_cached(tillit):
+    tillit._persistedQueries = False
+    tillit._session.post.side_effect = None
+    tillit._session.post.return_value = make_response({"errors": [{"message": "boom"}], "data": None})
+    payload = {"operationName": "equipments", "variables": {}, "query": tillit._schedulerQueries["equipments"]}
+
+    tillit.fetch_scheduler_graphql(payload)
+    tillit.fetch_scheduler_graphql(payload)
+
+    assert tillit._session.post.call_count == 2
+
+
+def test_materials_dtypes_match_with_and_without_properties(tillit):
+    plain = tillit.scheduler_get_materials(includeProperties=False)
+    with_props = tillit.scheduler_get_materials(includeProperties=True)
+
+    assert (with_props[plain.columns].dtypes == plain.dtypes).all()
+
+
+def test_bom_string_columns_share_one_arrow_dtype(tillit, monkeypatch):
+    monkeypatch.setitem(REST_RESPONSES, "/material-definitions", [
+        {"id": 1, "externalId": "P1", "description": "Product 1", "materialGroup": None},
+        {"id": 2, "externalId": "M1", "description": "Material 1", "materialGroup": None},
+    ])
+
+    bom = tillit.scheduler_get_bom_setup()
+
+    string_columns = bom.columns.drop(["Quantity", "Material Quantity", "Fixed Duration", "Rate", "Rate per Hour"])
+    assert (bom[string_columns].dtypes == pd.ArrowDtype(pa.string())).all()
+    by_operation = bom.set_index("Operation Code")
+    assert by_operation.loc["P1", "Operation Material Group"] == ''
+    assert pd.isna(by_operation.loc["P2", "Operation Material Group"])
+    assert by_operation.loc["P1", "Fixed Duration"] == 5
+
+
+def test_pluck_returns_arrow_strings():
+    plucked = pluck(pd.Series([{"externalId": "EC1"}, None, '{"externalId": "EC2"}']), "externalId")
+
+    assert plucked.dtype == pd.ArrowDtype(pa.string())
+    assert list(plucked.fillna('')) == ["EC1", '', "EC2"]
+
+
+def test_planned_order_priority_is_mapped_to_arrow_strings(tillit):
+    orders = tillit._scheduler_get_planned_order().set_index("orderNumber")
+
+    assert orders["priority"].dtype == pd.ArrowDtype(pa.string())
+    assert orders.loc["O1", "priority"] == "High"
+    assert orders.loc["O2", "priority"] == ''
+
+
+def test_planned_orders_without_any_items(tillit, monkeypatch):
+    orders = [dict(order, orderItems=[]) for order in GRAPHQL_RESPONSES["orders"]["data"]["getOrdersForScenario"]]
+    monkeypatch.setitem(GRAPHQL_RESPONSES, "orders", {"data": {"getOrdersForScenario": orders}})
+
+    planned = tillit._scheduler_get_planned_order()
+
+    assert planned["orderItemsId"].isna().all()
+    assert planned["ProductCode"].isna().all()
+    assert planned["ProductCode"].dtype == pd.ArrowDtype(pa.string())
+
+
+def test_orders_end_to_end(tillit):
+    orders = tillit.scheduler_get_orders(excludeCompleted=False).set_index("OrderNumber")
+
+    assert list(orders.index) == ["O1", "O2"]
+    assert orders.loc["O1", "Status"] == "PLANNED"
+    assert orders.loc["O2", "Status"] == "COMPLETED"
+    assert orders.loc["O1", "StartDateTime"] == pd.Timestamp("2023-11-14 22:13:20")
+
+
+def test_scheduled_order_lists_equipment_per_resource(tillit):
+    scheduled = tillit._scheduler_get_scheduled_order().set_index("orderItemId")
+
+    # resources 11 and 12 share externalId EQA
+    assert scheduled.loc[21, "Equipment"] == "EQA,EQA"
+    assert scheduled.loc[22, "Equipment"] == "EQB"
+
+
+def test_scheduled_order_reuses_memoized_equipment(tillit):
+    tillit._scheduler_get_scheduled_order()
+    # drop the TTL response cache only; the memoized equipment frame stays
+    tillit._cache.clear()
+
+    with mock.patch("Extract.ThreadPoolExecutor") as pool:
+        tillit._scheduler_get_scheduled_order()
+
+    pool.assert_not_called()
+    equipment_calls = [c for c in tillit._session.post.call_args_list if b'"equipments"' in c.kwargs["data"]]
+    # hash-only and full query, both from the first call
+    assert len(equipment_calls) == 2
+
+
+def test_fetch_results_are_copies_of_the_cache(tillit):
+    payload = {"operationName": "equipments", "variables": {}, "query": tillit._schedulerQueries["equipments"]}
+    operations = tillit._schedulerEndpoints["operations"]
+
+    tillit.fetch_scheduler_graphql(payload)["data"]["equipments"].clear()
+    tillit.fetch_scheduler(operations)[0]["operationCode"] = "changed"
+
+    assert len(tillit.fetch_scheduler_graphql(payload)["data"]["equipments"]) == 3
+    assert tillit.fetch_scheduler(operations)[0]["operationCode"] == "P1"
+    # the second calls were cache hits
+    assert tillit._session.get.call_count == 1